@@ -1,5 +1,6 @@
 import json
 import shutil
+import warnings
 from functools import wraps
 from inspect import Parameter, signature
 from pathlib import Path
@@ -13,11 +14,14 @@ from pydantic import (
     FilePath,
     PositiveInt,
     PrivateAttr,
+    TypeAdapter,
+    ValidationError,
     conset,
     field_serializer,
     field_validator,
     model_validator,
 )
+from pydantic_core import PydanticCustomError
 from pydantic_extra_types.color import Color
 
 from .logger import logger
@@ -26,6 +30,12 @@ Receiver = Callable[..., Any]
 
 
 class Signal(BaseModel):  # type: ignore[misc]
+    """
+    Key signal, see :meth:`Keys.dispatch_key_function`.
+
+    Deprecated, use :meth:`Keys.key_slots` instead.
+    """
+
     __receivers: list[Receiver] = PrivateAttr(default_factory=list)
 
     def connect(self, receiver: Receiver) -> None:
@@ -39,6 +49,15 @@ class Signal(BaseModel):  # type: ignore[misc]
             receiver(*args)
 
 
+def _warn_key_signals_deprecated() -> None:
+    warnings.warn(
+        "Key signals are deprecated and will be removed in the next major "
+        "version. Use 'Keys.key_slots' instead.",
+        DeprecationWarning,
+        stacklevel=3,
+    )
+
+
 def key_id(name: str) -> PositiveInt:
     """Avoid importing Qt too early."""
     from qtpy.QtCore import Qt
@@ -52,7 +71,7 @@ class Key(BaseModel):  # type: ignore[misc]
     ids: conset(PositiveInt, min_length=1)  # type: ignore[valid-type]
     name: Optional[str] = None
 
-    __signal: Signal = PrivateAttr(default_factory=Signal)
+    _signal: Signal = PrivateAttr(default_factory=Signal)
 
     def set_ids(self, *ids: int) -> None:
         self.ids = set(ids)
@@ -67,10 +86,22 @@ class Key(BaseModel):  # type: ignore[misc]
 
     @property
     def signal(self) -> Signal:
-        return self.__signal
+        """
+        Signal emitted by :meth:`Keys.dispatch_key_function`.
+
+        Deprecated, use :meth:`Keys.key_slots` instead.
+        """
+        _warn_key_signals_deprecated()
+        return self._signal
 
     def connect(self, function: Receiver) -> None:
-        self.__signal.connect(function)
+        """
+        Connect a function to this key's signal.
+
+        Deprecated, use :meth:`Keys.key_slots` instead.
+        """
+        _warn_key_signals_deprecated()
+        self._signal.connect(function)
 
     @field_serializer("ids")
     def serialize_dt(self, ids: set[int]) -> list[int]:
@@ -117,12 +148,32 @@ class Keys(BaseModel):  # type: ignore[misc]
 
         return self
 
+    def key_slots(
+        self, **slots: Callable[[], None]
+    ) -> dict[PositiveInt, Callable[[], None]]:
+        """
+        Return a mapping from key codes to slots.
+
+        :param slots: Slots, indexed by key names (e.g., ``QUIT``).
+        """
+        return {
+            key_id: slot
+            for key_name, slot in slots.items()
+            for key_id in getattr(self, key_name).ids
+        }
+
     def dispatch_key_function(self) -> Callable[[PositiveInt], None]:
+        """
+        Return a function that emits the signal of the pressed key.
+
+        Deprecated, use :meth:`key_slots` instead.
+        """
+        _warn_key_signals_deprecated()
         _dispatch = {}
 
         for _, key in self:
             for _id in key.ids:
-                _dispatch[_id] = key.signal
+                _dispatch[_id] = key._signal
 
         def dispatch(key: PositiveInt) -> None:
             if signal := _dispatch.get(key, None):
@@ -293,23 +344,58 @@ class PresentationConfig(BaseModel):  # type: ignore[misc]
     resolution: tuple[PositiveInt, PositiveInt] = (1920, 1080)
     background_color: Color = "black"
 
+    @staticmethod
+    def _load_raw(path: Path) -> dict[str, Any]:
+        """Read a raw presentation configuration from a file, resolving paths."""
+        with open(path) as f:
+            obj: dict[str, Any] = json.load(f)
+
+        slides = obj.setdefault("slides", [])
+        parent = path.parent.parent  # Never fails, but parents[1] can fail
+
+        for slide in slides:
+            if file := slide.get("file", None):
+                slide["file"] = parent / file
+
+            if rev_file := slide.get("rev_file", None):
+                slide["rev_file"] = parent / rev_file
+
+        return obj
+
     @classmethod
     def from_file(cls, path: Path) -> "PresentationConfig":
         """Read a presentation configuration from a file."""
-        with open(path) as f:
-            obj = json.load(f)
+        return cls.model_validate(cls._load_raw(path))  # type: ignore
 
-            slides = obj.setdefault("slides", [])
-            parent = path.parent.parent  # Never fails, but parents[1] can fail
-
-            for slide in slides:
-                if file := slide.get("file", None):
-                    slide["file"] = parent / file
+    @classmethod
+    def from_files(cls, paths: list[Path]) -> list["PresentationConfig"]:
+        """
+        Read multiple presentation configurations from files.
 
-                if rev_file := slide.get("rev_file", None):
-                    slide["rev_file"] = parent / rev_file
+        All configurations are validated in a single call, which is faster
+        than calling :meth:`from_file` on each path.
+        Validation errors are located by file, rather than by list index.
+        """
+        adapter = (
+            _PRESENTATION_CONFIGS_ADAPTER
+            if cls is PresentationConfig
+            else TypeAdapter(list[cls])  # type: ignore[valid-type]
+        )
 
-            return cls.model_validate(obj)  # type: ignore
+        try:
+            return adapter.validate_python([cls._load_raw(path) for path in paths])
+        except ValidationError as e:
+            raise ValidationError.from_exception_data(
+                e.title,
+                [
+                    {
+                        "type": PydanticCustomError(error["type"], error["msg"]),
+                        "loc": (str(paths[error["loc"][0]]), *error["loc"][1:]),  # type: ignore[index]
+                        "input": error["input"],
+                    }
+                    for error in e.errors()
+                ],
+            ) from None
 
     def to_file(self, path: Path) -> None:
         """Dump the presentation configuration to a file."""
@@ -336,3 +422,8 @@ class PresentationConfig(BaseModel):  # type: ignore[misc]
 
             if include_reversed and (not use_cached or not rev_dest.exists()):
                 shutil.copy(rev_file, rev_dest)
+
+
+_PRESENTATION_CONFIGS_ADAPTER: TypeAdapter[list[PresentationConfig]] = TypeAdapter(
+    list[PresentationConfig]
+)
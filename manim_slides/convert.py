@@ -16,12 +16,9 @@ from typing import Any, Callable, Optional, Union
 
 import av
 import click
-import pptx
 import requests
-from bs4 import BeautifulSoup
 from click import Context, Parameter
 from jinja2 import Template
-from lxml import etree
 from PIL import Image
 from pydantic import (
     BaseModel,
@@ -623,6 +620,8 @@ class RevealJS(Converter):
                 return
 
             # If offline, download remote assets and store them in the assets folder
+            from bs4 import BeautifulSoup
+
             soup = BeautifulSoup(content, "html.parser")
             session = requests.Session()
 
@@ -749,6 +748,11 @@ class PowerPoint(Converter):
 
     def convert_to(self, dest: Path) -> None:
         """Convert this configuration into a PowerPoint presentation, saved to DEST."""
+        # Imported here because they are only needed by this converter,
+        # and slow down every other command
+        import pptx
+        from lxml import etree
+
         prs = pptx.Presentation()
         prs.slide_width = self.width * 9525
         prs.slide_height = self.height * 9525
@@ -82,19 +82,19 @@ def get_scenes_presentation_config(
     if len(scenes) == 0:
         scenes = prompt_for_scenes(folder)
 
-    presentation_configs = []
+    config_files = []
     for scene in scenes:
         config_file = folder / f"{scene}.json"
         if not config_file.exists():
             raise click.UsageError(
                 f"File {config_file} does not exist, check the scene name and make sure to use Slide as your scene base class"
             )
-        try:
-            presentation_configs.append(PresentationConfig.from_file(config_file))
-        except ValidationError as e:
-            raise click.UsageError(str(e)) from None
+        config_files.append(config_file)
 
-    return presentation_configs
+    try:
+        return PresentationConfig.from_files(config_files)
+    except ValidationError as e:
+        raise click.UsageError(str(e)) from None
 
 
 def start_at_callback(
@@ -305,14 +305,14 @@ def present(  # noqa: C901
     screens = app.screens()
 
     def get_screen(number: int) -> Optional[QScreen]:
-        try:
+        if 0 <= number < len(screens):
             return screens[number]
-        except IndexError:
-            logger.error(
-                f"Invalid screen number {number}, "
-                f"allowed values are from 0 to {len(screens) - 1} (incl.)"
-            )
-            return None
+
+        logger.error(
+            f"Invalid screen number {number}, "
+            f"allowed values are from 0 to {len(screens) - 1} (incl.)"
+        )
+        return None
 
     should_hide_info_window = False
 
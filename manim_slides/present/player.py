@@ -1,12 +1,30 @@
-from datetime import datetime
+import os
+import time
+from functools import partial
 from pathlib import Path
-from typing import Optional
-
-from qtpy.QtCore import Qt, QTimer, QUrl, Signal, Slot
-from qtpy.QtGui import QCloseEvent, QIcon, QKeyEvent, QScreen
-from qtpy.QtMultimedia import QAudioOutput, QMediaPlayer, QVideoFrame
+from typing import Callable, Optional
+
+from qtpy.QtCore import (
+    QEvent,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    QUrl,
+    Signal,
+    Slot,
+)
+from qtpy.QtGui import (
+    QCloseEvent,
+    QHideEvent,
+    QKeyEvent,
+    QScreen,
+    QShowEvent,
+)
+from qtpy.QtMultimedia import QAudioOutput, QMediaPlayer, QVideoFrame, QVideoSink
 from qtpy.QtMultimediaWidgets import QVideoWidget
 from qtpy.QtWidgets import (
+    QGridLayout,
     QHBoxLayout,
     QLabel,
     QMainWindow,
@@ -16,23 +34,77 @@ from qtpy.QtWidgets import (
 
 from ..config import Config, PresentationConfig, SlideConfig
 from ..logger import logger
+from ..qt_utils import app_icon
 from ..resources import *  # noqa: F403
 
 WINDOW_NAME = "Manim Slides"
 
 
+def create_media_player(parent: Optional[QWidget] = None) -> QMediaPlayer:
+    """
+    Return a new media player, tuned for short local video files.
+
+    If supported (Qt>=6.10), the player is configured for low-latency
+    playback and a small probe size, which reduces the time needed to
+    open each slide's file.
+    """
+    media_player = QMediaPlayer(parent)
+
+    if hasattr(media_player, "setPlaybackOptions"):
+        from qtpy.QtMultimedia import QPlaybackOptions
+
+        options = QPlaybackOptions()
+        options.setPlaybackIntent(QPlaybackOptions.PlaybackIntent.LowLatencyStreaming)
+        options.setProbeSize(32 * 1024)
+        media_player.setPlaybackOptions(options)
+
+    return media_player
+
+
+class FileWarmer(QRunnable):  # type: ignore[misc]
+    """
+    Task that loads a file into the OS page cache, to be run in a thread pool.
+
+    This is only a hint, and any error is silently ignored.
+    """
+
+    def __init__(self, file: Path) -> None:
+        super().__init__()
+        self.file = file
+
+    def run(self) -> None:
+        try:
+            with open(self.file, "rb") as f:
+                if hasattr(os, "posix_fadvise"):
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_WILLNEED)
+                else:
+                    while f.read(1 << 20):
+                        pass
+        except OSError:
+            pass
+
+
+def counter_labels(count: int) -> list[str]:
+    """Return the ``"index/count"`` labels for every index in ``[1, count]``."""
+    return [f"{index:4d}/{count:<4d}" for index in range(1, count + 1)]
+
+
 class Info(QWidget):  # type: ignore[misc]
-    key_press_event: Signal = Signal(QKeyEvent)
-    close_event: Signal = Signal(QCloseEvent)
+    on_screen_changed: Signal = Signal(bool)
 
     def __init__(
         self,
         *,
         aspect_ratio_mode: Qt.AspectRatioMode,
         screen: Optional[QScreen],
+        on_close: Callable[[QCloseEvent], None],
+        on_key_press: Callable[[QKeyEvent], None],
     ) -> None:
         super().__init__()
 
+        self.on_close = on_close
+        self.on_key_press = on_key_press
+
         if screen:
             self.setScreen(screen)
             self.move(screen.geometry().topLeft())
@@ -54,48 +126,53 @@ class Info(QWidget):  # type: ignore[misc]
 
         # Current slide information
 
-        self.scene_label = QLabel()
-        self.slide_label = QLabel()
-        self.start_time = datetime.now()
+        # Scene and slide counters share one label, so changing slides
+        # only updates (and relayouts) a single widget
+        self.position_label = QLabel()
+        self.position_label.setTextFormat(Qt.TextFormat.RichText)
+        self.start_time = time.monotonic()
         self.time_label = QLabel()
         self.elapsed_label = QLabel("00h00m00s")
-        self.timer = QTimer()
-        self.timer.start(1000)  # every second
+        self._last_time_text = ""
+        self._last_elapsed_text = ""
+        self._on_screen = False
+        self.timer = QTimer(self)
+        # A coarse timer is accurate enough to display seconds and,
+        # unlike the default precise timer, does not raise the system timer
+        # resolution (notably on Windows).
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        # The timer is re-armed by 'update_time', so that every tick
+        # happens right after a wall-clock second boundary.
+        # It is only running while the window is visible, see 'showEvent'.
+        self.timer.setSingleShot(True)
         self.timer.timeout.connect(self.update_time)
 
-        bottom_left_layout = QHBoxLayout()
-        bottom_left_layout.addWidget(
-            QLabel("Scene:"),
-            alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignRight,
-        )
-        bottom_left_layout.addWidget(
-            self.scene_label,
-            alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft,
-        )
-        bottom_left_layout.addWidget(
-            QLabel("Slide:"),
-            alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignRight,
-        )
-        bottom_left_layout.addWidget(
-            self.slide_label,
-            alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft,
-        )
-        bottom_left_layout.addWidget(
-            QLabel("Time:"),
-            alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignRight,
-        )
-        bottom_left_layout.addWidget(
-            self.time_label,
-            alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft,
-        )
-        bottom_left_layout.addWidget(
-            QLabel("Elapsed:"),
-            alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignRight,
-        )
+        bottom_left_layout = QGridLayout()
+        bottom_left_layout.setContentsMargins(0, 0, 0, 0)
         bottom_left_layout.addWidget(
-            self.elapsed_label,
+            self.position_label,
+            0,
+            0,
             alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft,
         )
+        for column, (name, value_label) in enumerate(
+            [
+                ("Time:", self.time_label),
+                ("Elapsed:", self.elapsed_label),
+            ]
+        ):
+            bottom_left_layout.addWidget(
+                QLabel(name),
+                0,
+                2 * column + 1,
+                alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignRight,
+            )
+            bottom_left_layout.addWidget(
+                value_label,
+                0,
+                2 * column + 2,
+                alignment=Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft,
+            )
         left_layout.addLayout(bottom_left_layout)
         layout.addLayout(left_layout)
 
@@ -111,9 +188,12 @@ class Info(QWidget):  # type: ignore[misc]
         next_video_widget = QVideoWidget()
         next_video_widget.setAspectRatioMode(aspect_ratio_mode)
         next_video_widget.setFixedSize(360, 240)
-        self.next_media_player = QMediaPlayer()
+        self.next_media_player = create_media_player()
         self.next_media_player.setVideoOutput(next_video_widget)
-        self.next_media_player.setLoops(-1)
+        # Looping is done manually, and only while the window is on screen
+        self.next_media_player.mediaStatusChanged.connect(
+            self.next_media_status_changed
+        )
 
         right_layout.addWidget(next_video_widget)
 
@@ -138,29 +218,96 @@ class Info(QWidget):  # type: ignore[misc]
 
         self.setLayout(main_layout)
 
+    def set_position(self, scene: str, slide: str) -> None:
+        """Display the current scene and slide counters."""
+        self.position_label.setText(
+            f'<b>Scene:</b> <span style="white-space: pre">{scene}</span> '
+            f'<b>Slide:</b> <span style="white-space: pre">{slide}</span>'
+        )
+
+    @staticmethod
+    def msecs_to_next_second() -> int:
+        """Return the number of milliseconds until the next wall-clock second."""
+        return 1000 - time.time_ns() // 1_000_000 % 1000
+
     @Slot()
     def update_time(self) -> None:
-        now = datetime.now()
-        seconds = (now - self.start_time).total_seconds()
-        hours, seconds = divmod(seconds, 3600)
+        elapsed = int(time.monotonic() - self.start_time)
+        hours, seconds = divmod(elapsed, 3600)
         minutes, seconds = divmod(seconds, 60)
-        self.time_label.setText(now.strftime("%Y/%m/%d %H:%M:%S"))
-        self.elapsed_label.setText(
-            f"{int(hours):02d}h{int(minutes):02d}m{int(seconds):02d}s"
-        )
+        time_text = time.strftime("%Y/%m/%d %H:%M:%S")
+        elapsed_text = f"{hours:02d}h{minutes:02d}m{seconds:02d}s"
+
+        # Only update labels that changed, to avoid needless relayouts
+        if time_text != self._last_time_text:
+            self.time_label.setText(time_text)
+            self._last_time_text = time_text
+
+        if elapsed_text != self._last_elapsed_text:
+            self.elapsed_label.setText(elapsed_text)
+            self._last_elapsed_text = elapsed_text
+
+        self.timer.start(self.msecs_to_next_second())
+
+    def is_on_screen(self) -> bool:
+        """Return whether the window is visible and not minimized."""
+        return self.isVisible() and not self.isMinimized()
+
+    def update_on_screen_state(self) -> None:
+        """
+        Start the clock timer if the window is on screen, stop it otherwise,
+        and emit :attr:`on_screen_changed` if the state changed.
+        """
+        on_screen = self.is_on_screen()
+
+        if on_screen == self._on_screen:
+            return
+
+        self._on_screen = on_screen
+
+        if on_screen:
+            self.update_time()  # Refreshes the labels and starts the timer
+            if (
+                self.next_media_player.mediaStatus()
+                == QMediaPlayer.MediaStatus.EndOfMedia
+            ):
+                self.next_media_player.setPosition(0)
+                self.next_media_player.play()
+        else:
+            self.timer.stop()
+
+        self.on_screen_changed.emit(on_screen)
+
+    @Slot(QMediaPlayer.MediaStatus)
+    def next_media_status_changed(self, status: QMediaPlayer.MediaStatus) -> None:
+        if status == QMediaPlayer.MediaStatus.EndOfMedia and self.is_on_screen():
+            self.next_media_player.setPosition(0)
+            self.next_media_player.play()
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        super().showEvent(event)
+        self.update_on_screen_state()
+
+    def hideEvent(self, event: QHideEvent) -> None:  # noqa: N802
+        super().hideEvent(event)
+        self.update_on_screen_state()
+
+    def changeEvent(self, event: QEvent) -> None:  # noqa: N802
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.update_on_screen_state()
 
-    @Slot()
     def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802
-        self.close_event.emit(event)
+        self.on_close(event)
 
-    @Slot()
     def keyPressEvent(self, event: QKeyEvent) -> None:  # noqa: N802
-        self.key_press_event.emit(event)
+        self.on_key_press(event)
 
 
 class Player(QMainWindow):  # type: ignore[misc]
     presentation_changed: Signal = Signal()
     slide_changed: Signal = Signal()
+    prefetch_source_changed: Signal = Signal(QMediaPlayer)
 
     def __init__(
         self,
@@ -190,6 +337,19 @@ class Player(QMainWindow):  # type: ignore[misc]
         # Presentation configs
 
         self.presentation_configs = presentation_configs
+        self.__urls: dict[Path, QUrl] = {
+            file: QUrl.fromLocalFile(str(file))
+            for presentation_config in presentation_configs
+            for slide_config in presentation_config.slides
+            for file in (slide_config.file, slide_config.rev_file)
+        }
+        # Text of the scene and slide labels, indexed by
+        # presentation index, and by presentation then slide index
+        self.__scene_labels = counter_labels(len(presentation_configs))
+        self.__slide_labels = [
+            counter_labels(len(presentation_config.slides))
+            for presentation_config in presentation_configs
+        ]
         self.__current_presentation_index = 0
         self.__current_slide_index = 0
 
@@ -206,6 +366,10 @@ class Player(QMainWindow):  # type: ignore[misc]
             self.setScreen(screen)
             self.move(screen.geometry().topLeft())
 
+        # Cached window and cursor states, updated on change
+        self.__full_screen = full_screen
+        self.__mouse_hidden = hide_mouse
+
         if full_screen:
             self.setWindowState(Qt.WindowFullScreen)
         else:
@@ -219,10 +383,19 @@ class Player(QMainWindow):  # type: ignore[misc]
             self.setCursor(Qt.BlankCursor)
 
         self.setWindowTitle(WINDOW_NAME)
-        self.icon = QIcon(":/icon.png")
+        self.icon = app_icon()
         self.setWindowIcon(self.icon)
 
         self.frame = QVideoFrame()
+        self.__mirrored_frame = QVideoFrame()
+        # First frame of the prefetched files, indexed by URL, shown as soon
+        # as a file is loaded, before the decoder outputs anything
+        self.__first_frames: dict[str, QVideoFrame] = {}
+        # Prefetch media players whose first frame was not received yet
+        self.__awaiting_first_frame: set[QMediaPlayer] = set()
+        # Number of source changes, per prefetch media player, whose queued
+        # frames may still belong to a previous source
+        self.__pending_source_changes: dict[QMediaPlayer, int] = {}
 
         self.audio_output = QAudioOutput()
         self.video_widget = QVideoWidget()
@@ -230,52 +403,77 @@ class Player(QMainWindow):  # type: ignore[misc]
         self.video_widget.setAspectRatioMode(aspect_ratio_mode)
         self.setCentralWidget(self.video_widget)
 
-        self.media_player = QMediaPlayer(self)
+        self.media_player = create_media_player(self)
         self.media_player.setAudioOutput(self.audio_output)
         self.media_player.setVideoOutput(self.video_widget)
+        self.__loops = self.media_player.loops()
         self.playback_rate = playback_rate
 
-        self.presentation_changed.connect(self.presentation_changed_callback)
-        self.slide_changed.connect(self.slide_changed_callback)
+        # Hidden players that open the next slide's file, and the file
+        # played by 'reverse', in advance, so that switching slides
+        # does not have to wait for the file to be opened and demuxed
+        self.prefetch_media_players = [
+            create_media_player(self),
+            create_media_player(self),
+        ]
+        self.create_prefetch_video_sinks()
+
+        # Changing presentation also changes slide, so both signals
+        # are coalesced into one info update per event loop iteration
+        self.info_update_timer = QTimer(self)
+        self.info_update_timer.setSingleShot(True)
+        self.info_update_timer.setInterval(0)
+        self.info_update_timer.timeout.connect(self.update_info)
+
+        self.presentation_changed.connect(self.info_update_timer.start)
+        self.slide_changed.connect(self.info_update_timer.start)
 
         self.info = Info(
             aspect_ratio_mode=aspect_ratio_mode,
             screen=info_window_screen,
+            on_close=self.closeEvent,
+            on_key_press=self.keyPressEvent,
         )
-        self.info.close_event.connect(self.closeEvent)
-        self.info.key_press_event.connect(self.keyPressEvent)
+        self.info.on_screen_changed.connect(self.info_on_screen_changed)
         self.video_sink.videoFrameChanged.connect(self.frame_changed)
+        self.__mirroring_frames = False
         self.hide_info_window = hide_info_window
 
         # Connecting key callbacks
 
-        self.config.keys.QUIT.connect(self.close)
-        self.config.keys.PLAY_PAUSE.connect(self.play_pause)
-        self.config.keys.NEXT.connect(self.next)
-        self.config.keys.PREVIOUS.connect(self.previous)
-        self.config.keys.REVERSE.connect(self.reverse)
-        self.config.keys.REPLAY.connect(self.replay)
-        self.config.keys.FULL_SCREEN.connect(self.full_screen)
-        self.config.keys.HIDE_MOUSE.connect(self.hide_mouse)
-
-        self.dispatch = self.config.keys.dispatch_key_function()
+        self.__key_slots = self.config.keys.key_slots(
+            QUIT=self.close,
+            PLAY_PAUSE=self.play_pause,
+            NEXT=self.next,
+            PREVIOUS=self.previous,
+            REVERSE=self.reverse,
+            REPLAY=self.replay,
+            FULL_SCREEN=self.full_screen,
+            HIDE_MOUSE=self.hide_mouse,
+        )
 
         # Misc
 
         self.exit_after_last_slide = exit_after_last_slide
         self.next_terminates_loop = next_terminates_loop
 
+        # Fires when the current loop iteration ends, see 'next'.
+        # A coarse timer may fire early and cut the end of the iteration
+        self.__loop_position = 0
+        self.loop_termination_timer = QTimer(self)
+        self.loop_termination_timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self.loop_termination_timer.setSingleShot(True)
+        self.loop_termination_timer.timeout.connect(self.finish_loop)
+
         # Setting-up everything
 
         if skip_all:
 
             def media_status_changed(status: QMediaPlayer.MediaStatus) -> None:
-                self.media_player.setLoops(1)  # Otherwise looping slides never end
+                self.set_loops(1)  # Otherwise looping slides never end
                 if status == QMediaPlayer.MediaStatus.EndOfMedia:
                     self.load_next_slide()
 
-            self.media_player.mediaStatusChanged.connect(media_status_changed)
-
         else:
 
             def media_status_changed(status: QMediaPlayer.MediaStatus) -> None:
@@ -285,12 +483,18 @@ class Player(QMainWindow):  # type: ignore[misc]
                 ):
                     self.load_next_slide()
 
-            self.media_player.mediaStatusChanged.connect(media_status_changed)
+        # Stored so that it can be moved to the prefetched player on swaps
+        self.__media_status_changed = media_status_changed
+        self.media_player.mediaStatusChanged.connect(media_status_changed)
 
-        if self.current_slide_config.loop:
-            self.media_player.setLoops(-1)
+        # Cached to avoid querying the media player on every key press
+        self.__playback_state = self.media_player.playbackState()
+        self.media_player.playbackStateChanged.connect(self.playback_state_changed)
 
-        self.load_current_media(start_paused=start_paused)
+        self.load_current_media(
+            start_paused=start_paused,
+            loops=-1 if self.current_slide_config.loop else 1,
+        )
 
         self.presentation_changed.emit()
         self.slide_changed.emit()
@@ -377,6 +581,23 @@ class Player(QMainWindow):  # type: ignore[misc]
 
         return None
 
+    @property
+    def reversed_file(self) -> Path:
+        """Return the file that :meth:`reverse` would play."""
+        if self.playing_reversed_slide and self.current_slide_index >= 1:
+            return self.current_presentation_config.slides[  # type: ignore[no-any-return]
+                self.current_slide_index - 1
+            ].rev_file
+
+        return self.current_slide_config.rev_file  # type: ignore[no-any-return]
+
+    def get_url(self, file: Path) -> QUrl:
+        """Return the (cached) URL pointing to a local file."""
+        if (url := self.__urls.get(file)) is None:
+            url = self.__urls[file] = QUrl.fromLocalFile(str(file))
+
+        return url
+
     @property
     def playing_reversed_slide(self) -> bool:
         return self.__playing_reversed_slide
@@ -389,9 +610,48 @@ class Player(QMainWindow):  # type: ignore[misc]
     Loading slides
     """
 
-    def load_current_media(self, start_paused: bool = False) -> None:
-        url = QUrl.fromLocalFile(str(self.current_file))
-        self.media_player.setSource(url)
+    def set_loops(self, loops: int) -> None:
+        """Set the number of loops of the media player, only if it changed."""
+        if loops != self.__loops:
+            self.media_player.setLoops(loops)
+            self.__loops = loops
+
+    def load_current_media(
+        self, start_paused: bool = False, loops: Optional[int] = None
+    ) -> None:
+        """
+        Load the current file in the media player, and start playing it.
+
+        :param start_paused: Whether to pause the media player instead.
+        :param loops: If not :data:`None`, the number of loops to set
+            before loading the file.
+        """
+        self.loop_termination_timer.stop()  # Cancel any pending loop termination
+
+        url = self.get_url(self.current_file)
+
+        if loops is not None:
+            self.set_loops(loops)
+
+        if self.media_player.source() == url:
+            # Seeking is much cheaper than reloading the same source
+            self.media_player.setPosition(0)
+        else:
+            for index, prefetch_media_player in enumerate(self.prefetch_media_players):
+                if prefetch_media_player.source() == url:
+                    self.swap_media_players(index)
+                    break
+            else:
+                # Only the final state matters, so intermediate signals
+                # (e.g., stopping the previous media) are not forwarded
+                blocked = self.media_player.blockSignals(True)
+                self.media_player.setSource(url)
+                self.media_player.blockSignals(blocked)
+                self.__playback_state = self.media_player.playbackState()
+
+        if (first_frame := self.__first_frames.get(url.toString())) is not None:
+            self.frame = first_frame
+            self.video_sink.setVideoFrame(first_frame)
 
         if self.playing_reversed_slide:
             self.media_player.setPlaybackRate(
@@ -407,16 +667,66 @@ class Player(QMainWindow):  # type: ignore[misc]
         else:
             self.media_player.play()
 
+        self.prefetch_slides()
+
+    def create_prefetch_video_sinks(self) -> None:
+        """
+        Give each media player its own video sink.
+
+        A player's sink receives its frames while it is not the main player,
+        so that prefetched files are decoded up to their first frame,
+        see :meth:`prefetched_frame_changed`.
+        """
+        for media_player in (self.media_player, *self.prefetch_media_players):
+            video_sink = QVideoSink(media_player)
+            video_sink.videoFrameChanged.connect(
+                partial(self.prefetched_frame_changed, media_player),
+                Qt.ConnectionType.QueuedConnection,
+            )
+
+        for prefetch_media_player in self.prefetch_media_players:
+            prefetch_media_player.setVideoOutput(
+                prefetch_media_player.findChild(QVideoSink)
+            )
+
+        self.prefetch_source_changed.connect(
+            self.prefetch_source_loading, Qt.ConnectionType.QueuedConnection
+        )
+
+    def swap_media_players(self, index: int) -> None:
+        """
+        Swap the media player with a prefetch media player,
+        whose source is already loaded.
+
+        The previous media player is stopped and becomes a prefetch media player.
+
+        :param index: The index of the prefetch media player.
+        """
+        old, new = self.media_player, self.prefetch_media_players[index]
+
+        old.mediaStatusChanged.disconnect(self.__media_status_changed)
+        old.playbackStateChanged.disconnect(self.playback_state_changed)
+        old.stop()
+        old.setVideoOutput(old.findChild(QVideoSink))
+        old.setAudioOutput(None)
+
+        new.setAudioOutput(self.audio_output)
+        new.setVideoOutput(self.video_widget)
+        new.mediaStatusChanged.connect(self.__media_status_changed)
+        new.playbackStateChanged.connect(self.playback_state_changed)
+        self.__playback_state = new.playbackState()
+        if new.loops() != self.__loops:
+            new.setLoops(self.__loops)
+
+        self.media_player = new
+        self.prefetch_media_players[index] = old
+        # Its frames now go to the video widget
+        self.__awaiting_first_frame.discard(new)
+
     def load_current_slide(self) -> None:
         slide_config = self.current_slide_config
         self.current_file = slide_config.file
-
-        if slide_config.loop:
-            self.media_player.setLoops(-1)
-        else:
-            self.media_player.setLoops(1)
-
-        self.load_current_media()
+        self.load_current_media(loops=-1 if slide_config.loop else 1)
 
     def load_previous_slide(self) -> None:
         self.playing_reversed_slide = False
@@ -460,24 +770,77 @@ class Player(QMainWindow):  # type: ignore[misc]
     """
 
     @Slot()
-    def presentation_changed_callback(self) -> None:
-        index = self.current_presentation_index
-        count = self.presentations_count
-        self.info.scene_label.setText(f"{index + 1:4d}/{count:4<d}")
+    def update_info(self) -> None:
+        presentation_index = self.current_presentation_index
+        notes = self.current_slide_config.notes
+
+        # Repaint the info window once, after all labels are updated
+        self.info.setUpdatesEnabled(False)
+        try:
+            self.info.set_position(
+                self.__scene_labels[presentation_index],
+                self.__slide_labels[presentation_index][self.current_slide_index],
+            )
+            # Avoid parsing the same Markdown notes again
+            if notes != self.info.slide_notes.text():
+                self.info.slide_notes.setText(notes)
+        finally:
+            self.info.setUpdatesEnabled(True)
 
-    @Slot()
-    def slide_changed_callback(self) -> None:
-        index = self.current_slide_index
-        count = self.current_slides_count
-        self.info.slide_label.setText(f"{index + 1:4d}/{count:4<d}")
-        self.info.slide_notes.setText(self.current_slide_config.notes)
         self.preview_next_slide()
 
     def preview_next_slide(self) -> None:
         if slide_config := self.next_slide_config:
-            url = QUrl.fromLocalFile(str(slide_config.file))
-            self.info.next_media_player.setSource(url)
-            self.info.next_media_player.play()
+            url = self.get_url(slide_config.file)
+            next_media_player = self.info.next_media_player
+
+            # Reloading the same source would needlessly reset the decoder
+            if next_media_player.source() != url:
+                next_media_player.setSource(url)
+                next_media_player.play()
+            elif (
+                next_media_player.playbackState()
+                != QMediaPlayer.PlaybackState.PlayingState
+            ):
+                next_media_player.play()
+
+    def prefetch_slides(self) -> None:
+        current_file = self.current_file
+        files = [
+            file
+            for file in (self.next_file, self.reversed_file)
+            if file is not None and file != current_file
+        ]
+        urls = [self.get_url(file) for file in files]
+
+        # Players that already hold a wanted source are left untouched
+        free_players = [
+            player
+            for player in self.prefetch_media_players
+            if player.source() not in urls
+        ]
+        loaded_urls = [player.source() for player in self.prefetch_media_players]
+
+        # Only the first frames of the prefetched files can be needed next
+        wanted = {url.toString() for url in urls}
+        self.__first_frames = {
+            url: frame for url, frame in self.__first_frames.items() if url in wanted
+        }
+
+        for file, url in zip(files, urls):
+            if url not in loaded_urls:
+                # Reading the file is done off the GUI thread
+                QThreadPool.globalInstance().start(FileWarmer(file))
+                player = free_players.pop()
+                self.__pending_source_changes[player] = (
+                    self.__pending_source_changes.get(player, 0) + 1
+                )
+                self.__awaiting_first_frame.add(player)
+                player.setSource(url)
+                self.prefetch_source_changed.emit(player)
+                # Pausing forces the backend to open and demux the file
+                player.pause()
+                loaded_urls.append(url)
 
     def show(self, screens: list[QScreen]) -> None:
         """Screens is necessary to prevent the info window from being shown on the same screen as the main window (especially in full screen mode)."""
@@ -510,17 +873,54 @@ class Player(QMainWindow):  # type: ignore[misc]
 
     @Slot()
     def next(self) -> None:
-        if self.media_player.playbackState() == QMediaPlayer.PlaybackState.PausedState:
-            self.media_player.play()
-        elif self.next_terminates_loop and self.media_player.loops() != 1:
-            position = self.media_player.position()
-            self.media_player.setLoops(1)
-            self.media_player.stop()
-            self.media_player.setPosition(position)
+        if self.__playback_state == QMediaPlayer.PlaybackState.PausedState:
             self.media_player.play()
+        elif self.next_terminates_loop and self.__loops != 1:
+            # Let the current iteration finish, then stop looping
+            self.set_loops(1)
+            self.__loop_position = self.media_player.position()
+            self.start_loop_termination_timer()
         else:
             self.load_next_slide()
 
+    @Slot(QMediaPlayer.PlaybackState)
+    def playback_state_changed(self, state: QMediaPlayer.PlaybackState) -> None:
+        self.__playback_state = state
+
+    def start_loop_termination_timer(self) -> None:
+        """Arm the loop termination timer for the rest of the current iteration."""
+        remaining = self.media_player.duration() - self.media_player.position()
+        self.loop_termination_timer.start(
+            max(0, int(remaining / self.media_player.playbackRate()))
+        )
+
+    @Slot()
+    def finish_loop(self) -> None:
+        """
+        Stop a looping slide at the end of its current iteration.
+
+        The timer is only a fallback for backends that ignore
+        :meth:`QMediaPlayer.setLoops` during playback. Backends that honor it
+        reach the end of the media on their own, and the media status handler
+        takes care of auto-next slides, so the timer is ignored. If it fires
+        before the iteration is over, it is re-armed for the remaining time.
+
+        Otherwise, the media player is stopped, so that the next key press
+        loads the next slide.
+        """
+        if self.media_player.mediaStatus() == QMediaPlayer.MediaStatus.EndOfMedia:
+            return
+
+        position = self.media_player.position()
+
+        if self.__loop_position <= position < self.media_player.duration():
+            self.__loop_position = position
+            self.start_loop_termination_timer()
+        elif self.current_slide_config.auto_next:
+            self.load_next_slide()
+        else:
+            self.media_player.stop()
+
     @Slot()
     def previous(self) -> None:
         self.load_previous_slide()
@@ -540,7 +940,7 @@ class Player(QMainWindow):  # type: ignore[misc]
 
     @Slot()
     def play_pause(self) -> None:
-        state = self.media_player.playbackState()
+        state = self.__playback_state
         if state == QMediaPlayer.PlaybackState.PausedState:
             self.media_player.play()
         elif state == QMediaPlayer.PlaybackState.PlayingState:
@@ -548,7 +948,7 @@ class Player(QMainWindow):  # type: ignore[misc]
 
     @Slot()
     def full_screen(self) -> None:
-        if self.windowState() == Qt.WindowFullScreen:
+        if self.__full_screen:
             self.setWindowState(Qt.WindowNoState)
             self.info.setWindowState(Qt.WindowNoState)
         else:
@@ -557,10 +957,8 @@ class Player(QMainWindow):  # type: ignore[misc]
 
     @Slot()
     def hide_mouse(self) -> None:
-        if self.cursor().shape() == Qt.BlankCursor:
-            self.setCursor(Qt.ArrowCursor)
-        else:
-            self.setCursor(Qt.BlankCursor)
+        self.__mouse_hidden = not self.__mouse_hidden
+        self.setCursor(Qt.BlankCursor if self.__mouse_hidden else Qt.ArrowCursor)
 
     def frame_changed(self, frame: QVideoFrame) -> None:
         """
@@ -588,12 +986,104 @@ class Player(QMainWindow):  # type: ignore[misc]
         else:
             self.video_sink.setVideoFrame(self.frame)  # Reuse previous frame
 
+    def prefetched_frame_changed(
+        self, media_player: QMediaPlayer, frame: QVideoFrame
+    ) -> None:
+        """
+        Slot to cache the first frame of prefetched files.
+
+        This slot is called in the GUI thread, so the player
+        can be safely asked for its source.
+        Frames that were queued before the player's source changed
+        belong to the previous source, so they are ignored,
+        see :meth:`prefetch_source_loading`. So are the frames
+        of players that are not loading a file, e.g.,
+        a previous main player.
+
+        :param media_player: The media player that owns the video sink.
+        :param frame: The most recent frame of the media player.
+        """
+        if (
+            not frame.isValid()
+            or media_player not in self.__awaiting_first_frame
+            or self.__pending_source_changes.get(media_player, 0) > 0
+        ):
+            return
+
+        self.__awaiting_first_frame.discard(media_player)
+        self.__first_frames[media_player.source().toString()] = frame
+
+    @Slot(QMediaPlayer)
+    def prefetch_source_loading(self, media_player: QMediaPlayer) -> None:
+        """
+        Slot to accept frames from a prefetch media player again.
+
+        It is queued right after the player's source is changed, so it runs
+        after all the frames that were queued before, which may belong
+        to the previous source.
+
+        :param media_player: The prefetch media player.
+        """
+        self.__pending_source_changes[media_player] -= 1
+
+    def mirror_frame(self, frame: QVideoFrame) -> None:
+        """
+        Slot to copy the current frame to the info window.
+
+        It is only connected while the info window is on screen,
+        see :meth:`info_on_screen_changed`.
+
+        Invalid frames are replaced by the previous frame, see
+        :meth:`frame_changed`, so the same frame is not pushed twice.
+
+        :param frame: The most recent frame (unused, as it may be invalid).
+        """
+        if self.frame == self.__mirrored_frame:
+            return
+
+        self.__mirrored_frame = self.frame
         self.info.video_sink.setVideoFrame(self.frame)
 
+    @Slot(bool)
+    def info_on_screen_changed(self, on_screen: bool) -> None:
+        if on_screen and not self.__mirroring_frames:
+            self.video_sink.videoFrameChanged.connect(self.mirror_frame)
+            self.__mirrored_frame = self.frame
+            self.info.video_sink.setVideoFrame(self.frame)
+            self.__mirroring_frames = True
+        elif not on_screen and self.__mirroring_frames:
+            self.video_sink.videoFrameChanged.disconnect(self.mirror_frame)
+            self.__mirroring_frames = False
+
+    def changeEvent(self, event: QEvent) -> None:  # noqa: N802
+        super().changeEvent(event)
+        if event.type() == QEvent.Type.WindowStateChange:
+            self.__full_screen = self.windowState() == Qt.WindowFullScreen
+
     def closeEvent(self, event: QCloseEvent) -> None:  # noqa: N802
         self.close()
 
     def keyPressEvent(self, event: QKeyEvent) -> None:  # noqa: N802
-        key = event.key()
-        self.dispatch(key)
-        event.accept()
+        if (slot := self.__key_slots.get(event.key())) is not None:
+            # Holding a key at either end of the slides would
+            # otherwise log the same message many times per second
+            if not (event.isAutoRepeat() and self.is_at_boundary(slot)):
+                slot()
+            event.accept()
+        else:
+            event.ignore()
+
+    def is_at_boundary(self, slot: Callable[[], None]) -> bool:
+        """Return whether ``slot`` is :meth:`next` or :meth:`previous` and has no effect."""
+        if slot == self.next:
+            return (
+                self.next_slide_config is None
+                and self.__playback_state != QMediaPlayer.PlaybackState.PausedState
+                and self.__loops == 1
+            )
+        elif slot == self.previous:
+            return (
+                self.current_presentation_index == 0 and self.current_slide_index == 0
+            )
+
+        return False
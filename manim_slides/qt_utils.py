@@ -1,14 +1,44 @@
 """Qt utils."""
 
+from functools import lru_cache
+from typing import Optional
+
+from qtpy.QtGui import QIcon
 from qtpy.QtWidgets import QApplication
 
+from . import resources  # noqa: F401
+
+_APP: Optional[QApplication] = None
+
 
 def qapp() -> QApplication:
     """
     Return a QApplication instance, creating one
     if needed.
+
+    The instance is cached, see :func:`reset_qapp`.
     """
-    if app := QApplication.instance():
-        return app
+    global _APP
+
+    if _APP is None:
+        _APP = QApplication.instance() or QApplication([])
+
+    return _APP
+
+
+def reset_qapp() -> None:
+    """
+    Clear the cached QApplication instance.
+
+    This must be called if the instance is destroyed,
+    so that the next call to :func:`qapp` does not return it.
+    """
+    global _APP
+
+    _APP = None
+
 
-    return QApplication([])
+@lru_cache(maxsize=1)
+def app_icon() -> QIcon:
+    """Return the Manim Slides icon, decoded only once."""
+    return QIcon(":/icon.png")
@@ -10,6 +10,7 @@ This is especially useful for two reasons:
 2. You can pass options to the config.
 """
 
+import runpy
 import subprocess
 import sys
 
@@ -48,6 +49,39 @@ def render(ce: bool, gl: bool, args: tuple[str, ...]) -> None:
     if ce and gl:
         raise click.UsageError("You cannot specify both --CE and --GL renderers.")
     if gl:
-        subprocess.run([sys.executable, "-m", "manimlib", "-w", *args])
+        run_module("manimlib", "-w", *args)
     else:
-        subprocess.run([sys.executable, "-m", "manim", "render", *args])
+        run_module("manim", "render", *args)
+
+
+def run_module(module: str, *args: str) -> None:
+    """
+    Run a module as ``python -m <module> [ARGS]...``.
+
+    The module is run in the current interpreter, which avoids the cost
+    of starting a new one and importing everything again.
+    However, both Manim and ManimGL read their configuration when they are
+    first imported, so a new interpreter is used if the module was already
+    imported.
+    """
+    if module in sys.modules:
+        proc = subprocess.run([sys.executable, "-m", module, *args])
+        if proc.returncode:
+            raise click.exceptions.Exit(proc.returncode)
+        return
+
+    argv = sys.argv
+    sys.argv = [module, *args]
+
+    try:
+        runpy.run_module(module, run_name="__main__", alter_sys=True)
+    except SystemExit as e:
+        if e.code:
+            if isinstance(e.code, int):
+                raise click.exceptions.Exit(e.code) from None
+
+            # Like Python, print the exit message and exit with 1
+            click.echo(e.code, err=True)
+            raise click.exceptions.Exit(1) from None
+    finally:
+        sys.argv = argv
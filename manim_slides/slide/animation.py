@@ -12,6 +12,7 @@ that directly calls ``self.play(Animation(...))``, see
 __all__ = ["Wipe", "Zoom"]
 
 from collections.abc import Mapping, Sequence
+from functools import partial
 from typing import Any, Optional
 
 import numpy as np
@@ -71,21 +72,19 @@ class Wipe(AnimationGroup):  # type: ignore[misc]
         fade_out_kwargs: Optional[Mapping[str, Any]] = None,
         **kwargs: Any,
     ):
-        animations = []
+        if fade_in_kwargs is None:
+            fade_in_kwargs = {}
 
-        if future:
-            if fade_in_kwargs is None:
-                fade_in_kwargs = {}
+        if fade_out_kwargs is None:
+            fade_out_kwargs = {}
 
-            for mobject in future:
-                animations.append(FadeIn(mobject, shift=shift, **fade_in_kwargs))
+        fade_in = partial(FadeIn, shift=shift, **fade_in_kwargs)
+        fade_out = partial(FadeOut, shift=shift, **fade_out_kwargs)
 
-        if current:
-            if fade_out_kwargs is None:
-                fade_out_kwargs = {}
-
-            for mobject in current:
-                animations.append(FadeOut(mobject, shift=shift, **fade_out_kwargs))
+        animations = [
+            *map(fade_in, future or ()),
+            *map(fade_out, current or ()),
+        ]
 
         super().__init__(*animations, **kwargs)
 
@@ -143,20 +142,18 @@ class Zoom(AnimationGroup):  # type: ignore[misc]
         if out:
             scale_in, scale_out = scale_out, scale_in
 
-        animations = []
-
-        if future:
-            if fade_in_kwargs is None:
-                fade_in_kwargs = {}
+        if fade_in_kwargs is None:
+            fade_in_kwargs = {}
 
-            for mobject in future:
-                animations.append(FadeIn(mobject, scale=scale_in, **fade_in_kwargs))
+        if fade_out_kwargs is None:
+            fade_out_kwargs = {}
 
-        if current:
-            if fade_out_kwargs is None:
-                fade_out_kwargs = {}
+        fade_in = partial(FadeIn, scale=scale_in, **fade_in_kwargs)
+        fade_out = partial(FadeOut, scale=scale_out, **fade_out_kwargs)
 
-            for mobject in current:
-                animations.append(FadeOut(mobject, scale=scale_out, **fade_out_kwargs))
+        animations = [
+            *map(fade_in, future or ()),
+            *map(fade_out, current or ()),
+        ]
 
         super().__init__(*animations, **kwargs)
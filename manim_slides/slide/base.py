@@ -2,10 +2,11 @@ from __future__ import annotations
 
 __all__ = ["BaseSlide"]
 
+import os
 import platform
 import shutil
 from abc import abstractmethod
-from collections.abc import MutableMapping, Sequence, ValuesView
+from collections.abc import Iterator, MutableMapping, Sequence, ValuesView
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
@@ -18,7 +19,7 @@ from tqdm import tqdm
 from ..config import BaseSlideConfig, PresentationConfig, PreSlideConfig, SlideConfig
 from ..defaults import FOLDER_PATH
 from ..logger import logger
-from ..utils import concatenate_video_files, merge_basenames, reverse_video_file
+from ..utils import concatenate_video_files, merge_basenames, reverse_video_files
 from . import MANIM
 
 if TYPE_CHECKING:
@@ -38,6 +39,7 @@ class BaseSlide:
     skip_reversing: bool = False
     max_duration_before_split_reverse: float | None = 4.0
     num_processes: int | None = None
+    reverse_preset: str = "ultrafast"
 
     def __init__(
         self, *args: Any, output_folder: Path = FOLDER_PATH, **kwargs: Any
@@ -213,10 +215,12 @@ class BaseSlide:
 
             :attr:`canvas` for usage examples.
         """
+        # Comparing identities avoids a linear search in the canvas per Mobject
+        canvas_ids = {id(mobject) for mobject in self.canvas_mobjects}
         return [
             mobject
             for mobject in self.mobjects  # type: ignore[attr-defined]
-            if mobject not in self.canvas_mobjects
+            if id(mobject) not in canvas_ids
         ]
 
     @property
@@ -529,8 +533,12 @@ class BaseSlide:
         scene_name = str(self)
         scene_files_folder = files_folder / scene_name
 
-        if flush_cache and scene_files_folder.exists():
-            shutil.rmtree(scene_files_folder)
+        if flush_cache:
+            # Other errors must propagate, or stale files would be reused below
+            try:
+                shutil.rmtree(scene_files_folder)
+            except FileNotFoundError:
+                pass  # Nothing to flush
 
         scene_files_folder.mkdir(parents=True, exist_ok=True)
 
@@ -546,55 +554,95 @@ class BaseSlide:
                 slide.end_animation -= offset
 
         slides: list[SlideConfig] = []
+        tqdm_kwargs: dict[str, Any] = {
+            "leave": self._leave_progress_bar,
+            "ascii": True if platform.system() == "Windows" else None,
+            "disable": not self._show_progress_bar,
+            "mininterval": 0.5,  # Avoid flooding slow terminals and CI logs
+        }
+
+        # Files are written atomically, but empty files may have been left
+        # by interrupted renders of previous versions, so they are not reused
+        cached_files = (
+            {
+                entry.name: entry.stat().st_size
+                for entry in os.scandir(scene_files_folder)
+            }
+            if use_cache
+            else {}
+        )
 
-        for pre_slide_config in tqdm(
-            self._slides,
-            desc=f"Concatenating animations to '{scene_files_folder}' and generating reversed animations",
-            leave=self._leave_progress_bar,
-            ascii=True if platform.system() == "Windows" else None,
-            disable=not self._show_progress_bar,
-            unit=" slides",
-        ):
-            if pre_slide_config.skip_animations:
-                continue
-            if pre_slide_config.src:
-                slide_files = [pre_slide_config.src]
-            else:
-                slide_files = files[pre_slide_config.slides_slice]
-
-            try:
-                file = merge_basenames(slide_files)
-            except ValueError as e:
-                raise ValueError(
-                    f"Failed to merge basenames of files for slide: {pre_slide_config!r}"
-                ) from e
-            dst_file = scene_files_folder / file.name
-            rev_file = scene_files_folder / f"{file.stem}_reversed{file.suffix}"
-
-            # We only concat animations if it was not present
-            if not use_cache or not dst_file.exists():
-                concatenate_video_files(slide_files, dst_file)
-
-            # We only reverse video if it was not present
-            if not use_cache or not rev_file.exists():
-                if skip_reversing:
-                    rev_file = dst_file
+        # Files produced during this save, as identical slides share the same files
+        produced_files: set[str] = set()
+
+        def is_cached(file: Path) -> bool:
+            return file.name in produced_files or cached_files.get(file.name, 0) > 0
+
+        def concatenate_slides() -> Iterator[tuple[Path, Path]]:
+            """Concatenate animations and yield the slide files to reverse."""
+            for pre_slide_config in tqdm(
+                self._slides,
+                desc=f"Concatenating animations to '{scene_files_folder}'",
+                unit=" slides",
+                **tqdm_kwargs,
+            ):
+                if pre_slide_config.skip_animations:
+                    continue
+                if pre_slide_config.src:
+                    slide_files = [pre_slide_config.src]
                 else:
-                    reverse_video_file(
-                        dst_file,
-                        rev_file,
-                        max_segment_duration=self.max_duration_before_split_reverse,
-                        num_processes=self.num_processes,
-                        leave=self._leave_progress_bar,
-                        ascii=True if platform.system() == "Windows" else None,
-                        disable=not self._show_progress_bar,
+                    slide_files = files[pre_slide_config.slides_slice]
+
+                try:
+                    file = merge_basenames(slide_files)
+                except ValueError as e:
+                    raise ValueError(
+                        f"Failed to merge basenames of files for slide: {pre_slide_config!r}"
+                    ) from e
+                dst_file = scene_files_folder / file.name
+                rev_file = scene_files_folder / f"{file.stem}_reversed{file.suffix}"
+
+                # We only concat animations if it was not present
+                if not is_cached(dst_file):
+                    concatenate_video_files(slide_files, dst_file)
+                    produced_files.add(dst_file.name)
+
+                # We only reverse video if it was not present
+                if not is_cached(rev_file):
+                    if skip_reversing:
+                        rev_file = dst_file
+                    else:
+                        produced_files.add(rev_file.name)
+                        yield dst_file, rev_file
+
+                slides.append(
+                    SlideConfig.from_pre_slide_config_and_files(
+                        pre_slide_config, dst_file, rev_file
                     )
-
-            slides.append(
-                SlideConfig.from_pre_slide_config_and_files(
-                    pre_slide_config, dst_file, rev_file
                 )
-            )
+
+        # Reversing is the most expensive step, so slides are reversed
+        # by multiple processes while the next ones are being concatenated
+        reverse_video_files(
+            concatenate_slides(),
+            max_segment_duration=self.max_duration_before_split_reverse,
+            num_processes=self.num_processes,
+            preset=self.reverse_preset,
+            **tqdm_kwargs,
+        )
+
+        # Files from previous renders that are no longer used would
+        # otherwise accumulate forever, but we keep them when only
+        # part of the scene was rendered, or when some slides were
+        # skipped, as they are still needed by later renders
+        if not offset and not any(
+            pre_slide_config.skip_animations for pre_slide_config in self._slides
+        ):
+            used_files = {
+                file.name for slide in slides for file in (slide.file, slide.rev_file)
+            }
+            for name in cached_files.keys() - used_files:
+                (scene_files_folder / name).unlink(missing_ok=True)
 
         logger.info(
             f"Generated {len(slides)} slides to '{scene_files_folder.absolute()}'"
@@ -681,11 +729,10 @@ class BaseSlide:
         """
         from .animation import Wipe
 
-        shift_amount = np.asarray(direction) * np.array(
-            [self._frame_width, self._frame_height, 0.0]
-        )
-
-        kwargs.setdefault("shift", shift_amount)
+        if "shift" not in kwargs:
+            kwargs["shift"] = np.asarray(direction) * np.array(
+                [self._frame_width, self._frame_height, 0.0]
+            )
 
         animation = Wipe(
             *args,
@@ -40,6 +40,11 @@ class Slide(BaseSlide, Scene):  # type: ignore[misc]
         If :data:`None`, defaults to :func:`os.process_cpu_count`.
         This is currently used when generating reversed animations, and can
         increase memory consumption.
+    :cvar str reverse_preset: :data:`"ultrafast"`: The libx264 preset used
+        to encode reversed animations.
+        The fastest preset is used by default, as reversing animations is
+        the most expensive step when saving slides. Slower presets produce
+        smaller files, at the same quality, but take much longer to encode.
     """
 
     def __init__(self, *args: Any, **kwargs: Any) -> None:
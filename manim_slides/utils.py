@@ -2,8 +2,13 @@ import hashlib
 import os
 import shutil
 import tempfile
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from functools import partial
 from multiprocessing import Pool
+from multiprocessing.pool import AsyncResult
+from multiprocessing.pool import Pool as PoolType
+from operator import length_hint
 from pathlib import Path
 from typing import Any, Optional
 
@@ -13,10 +18,62 @@ from tqdm import tqdm
 from .logger import logger
 
 
+@contextmanager
+def atomic_write(dest: Path) -> Iterator[Path]:
+    """
+    Return a temporary path, next to ``dest``, that replaces it on success.
+
+    An interrupted write then never leaves a truncated ``dest`` behind,
+    which would be mistaken for a cached file.
+    The temporary path has the same suffix, so that the container
+    format can still be guessed from it.
+    """
+    tmp = dest.with_name(f".{dest.stem}.{os.getpid()}.tmp{dest.suffix}")
+
+    try:
+        yield tmp
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+
+def copy_file(src: Path, dest: Path) -> None:
+    """
+    Copy a file, letting the kernel do the copy when possible.
+
+    On Linux, :func:`os.copy_file_range` avoids copying the data through
+    user space, and even shares the data blocks on filesystems that
+    support reflinks (e.g., Btrfs or XFS).
+
+    The file is never hard-linked, as renderers overwrite some of their
+    files in place, which would also modify the copy.
+    """
+    # Replacing the file also never writes through a link,
+    # e.g., created by a previous version
+    with atomic_write(dest) as tmp:
+        if hasattr(os, "copy_file_range"):
+            try:
+                with open(src, "rb") as fsrc, open(tmp, "wb") as fdst:
+                    remaining = os.fstat(fsrc.fileno()).st_size
+                    while remaining > 0:
+                        copied = os.copy_file_range(
+                            fsrc.fileno(), fdst.fileno(), remaining
+                        )
+                        if copied == 0:
+                            break
+                        remaining -= copied
+                    else:
+                        return
+            except OSError as e:
+                logger.debug(f"Could not copy {src} with copy_file_range: {e}")
+
+        shutil.copyfile(src, tmp)
+
+
 def concatenate_video_files(files: list[Path], dest: Path) -> None:
     """Concatenate multiple video files into one."""
     if len(files) == 1:
-        shutil.copy(files[0], dest)
+        copy_file(files[0], dest)
         return
 
     def _filter(files: list[Path]) -> Iterator[Path]:
@@ -39,7 +96,8 @@ def concatenate_video_files(files: list[Path], dest: Path) -> None:
 
     with (
         av.open(tmp_file, format="concat", options={"safe": "0"}) as input_container,
-        av.open(str(dest), mode="w") as output_container,
+        atomic_write(dest) as tmp_dest,
+        av.open(str(tmp_dest), mode="w") as output_container,
     ):
         input_video_stream = input_container.streams.video[0]
         output_video_stream = output_container.add_stream(
@@ -96,16 +154,25 @@ def link_nodes(*nodes: av.filter.context.FilterContext) -> None:
         c.link_to(n)
 
 
-def reverse_video_file_in_one_chunk(src_and_dest: tuple[Path, Path]) -> None:
-    """Reverses a video file, writing the result to `dest`."""
+def reverse_video_file_in_one_chunk(
+    src_and_dest: tuple[Path, Path], preset: str = "ultrafast"
+) -> None:
+    """
+    Reverses a video file, writing the result to `dest`.
+
+    The ``preset`` is the libx264 preset used to encode the reversed video.
+    """
     src, dest = src_and_dest
     with (
         av.open(str(src)) as input_container,
-        av.open(str(dest), mode="w") as output_container,
+        atomic_write(dest) as tmp_dest,
+        av.open(str(tmp_dest), mode="w") as output_container,
     ):
         input_stream = input_container.streams.video[0]
         output_stream = output_container.add_stream(
-            codec_name="libx264", rate=input_stream.base_rate
+            codec_name="libx264",
+            rate=input_stream.base_rate,
+            options={"preset": preset},
         )
         output_stream.width = input_stream.width
         output_stream.height = input_stream.height
@@ -135,24 +202,105 @@ def reverse_video_file_in_one_chunk(src_and_dest: tuple[Path, Path]) -> None:
             output_container.mux(packet)
 
 
+def video_file_duration(src: Path) -> Optional[float]:
+    """Return the duration of a video file in seconds, if known."""
+    with av.open(str(src)) as input_container:
+        input_stream = input_container.streams.video[0]
+        if input_stream.duration:
+            return float(input_stream.duration * input_stream.time_base)
+        return None  # pragma: no cover
+
+
+def reverse_video_files(
+    srcs_and_dests: Iterable[tuple[Path, Path]],
+    max_segment_duration: Optional[float] = 4.0,
+    num_processes: Optional[int] = None,
+    preset: str = "ultrafast",
+    **tqdm_kwargs: Any,
+) -> None:
+    """
+    Reverse multiple video files, writing each result to its destination.
+
+    Files that are short enough are reversed in parallel, one per process,
+    as soon as they are produced by ``srcs_and_dests``, so the latter can
+    be a generator that creates the files. It is consumed in the calling
+    thread, so its exceptions propagate unchanged. Longer files are reversed
+    afterward, one at a time, each one being split into segments
+    that are reversed in parallel.
+    """
+    long_files: list[tuple[Path, Path]] = []
+    results: list[AsyncResult[None]] = []
+    reverse = partial(reverse_video_file_in_one_chunk, preset=preset)
+
+    # Never start more processes than there are files, if we know how many
+    processes = num_processes or os.cpu_count() or 1
+    if num_files := length_hint(srcs_and_dests):
+        processes = min(processes, num_files)
+
+    with ExitStack() as stack:
+        pool: Optional[PoolType] = None
+        # Only start the processes if there is more than one file to reverse
+        pending: Optional[tuple[Path, Path]] = None
+
+        for src, dest in srcs_and_dests:
+            if max_segment_duration is not None and (
+                (duration := video_file_duration(src)) is None
+                or duration > max_segment_duration
+            ):
+                long_files.append((src, dest))
+                continue
+
+            if pool is None:
+                if pending is None:
+                    pending = (src, dest)
+                    continue
+
+                pool = stack.enter_context(Pool(processes))
+                results.append(pool.apply_async(reverse, (pending,)))
+
+            results.append(pool.apply_async(reverse, ((src, dest),)))
+
+        if pool is None and pending is not None:
+            reverse(pending)
+
+        for result in tqdm(
+            results,
+            desc="Reversing animations",
+            unit=" files",
+            **tqdm_kwargs,
+        ):
+            result.get()
+
+    for src, dest in long_files:
+        reverse_video_file(
+            src,
+            dest,
+            max_segment_duration=max_segment_duration,
+            num_processes=num_processes,
+            preset=preset,
+            **tqdm_kwargs,
+        )
+
+
 def reverse_video_file(
     src: Path,
     dest: Path,
     max_segment_duration: Optional[float] = 4.0,
     num_processes: Optional[int] = None,
+    preset: str = "ultrafast",
     **tqdm_kwargs: Any,
 ) -> None:
     """Reverses a video file, writing the result to `dest`."""
     with av.open(str(src)) as input_container:  # Fast path if file is short enough
         input_stream = input_container.streams.video[0]
         if max_segment_duration is None:
-            return reverse_video_file_in_one_chunk((src, dest))
+            return reverse_video_file_in_one_chunk((src, dest), preset=preset)
         elif input_stream.duration:
             if (
                 float(input_stream.duration * input_stream.time_base)
                 <= max_segment_duration
             ):
-                return reverse_video_file_in_one_chunk((src, dest))
+                return reverse_video_file_in_one_chunk((src, dest), preset=preset)
         else:  # pragma: no cover
             logger.debug(
                 f"Could not determine duration of {src}, falling back to segmentation."
@@ -177,15 +325,18 @@ def reverse_video_file(
                     packet.stream = output_stream
                     output_container.mux(packet)
 
-            src_files = list(tmpdir.iterdir())
+            src_files = sorted(tmpdir.iterdir())
             rev_files = [
                 src_file.with_stem("rev_" + src_file.stem) for src_file in src_files
             ]
 
-            with Pool(num_processes, maxtasksperchild=1) as pool:
+            processes = min(num_processes or os.cpu_count() or 1, len(src_files))
+
+            with Pool(processes, maxtasksperchild=1) as pool:
                 for _ in tqdm(
                     pool.imap_unordered(
-                        reverse_video_file_in_one_chunk, zip(src_files, rev_files)
+                        partial(reverse_video_file_in_one_chunk, preset=preset),
+                        zip(src_files, rev_files),
                     ),
                     desc="Reversing large file by cutting it in segments",
                     total=len(src_files),
@@ -2,7 +2,7 @@ from functools import partial
 from typing import Any
 
 from qtpy.QtCore import Qt
-from qtpy.QtGui import QIcon, QKeyEvent
+from qtpy.QtGui import QKeyEvent
 from qtpy.QtWidgets import (
     QDialog,
     QDialogButtonBox,
@@ -16,6 +16,7 @@ from qtpy.QtWidgets import (
 
 from ..config import Config, Key
 from ..logger import logger
+from ..qt_utils import app_icon
 from ..resources import *  # noqa: F403
 
 WINDOW_NAME: str = "Configuration Wizard"
@@ -49,7 +50,7 @@ class Wizard(QWidget):  # type: ignore
 
         self.setWindowTitle(WINDOW_NAME)
         self.config = config
-        self.icon = QIcon(":/icon.png")
+        self.icon = app_icon()
         self.setWindowIcon(self.icon)
         self.closed_without_saving = False
 
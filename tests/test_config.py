@@ -1,9 +1,11 @@
+import shutil
+from pathlib import Path
 from typing import Any
 
 import pytest
 from pydantic import ValidationError
 
-from manim_slides.config import Key, PresentationConfig
+from manim_slides.config import Key, Keys, PresentationConfig
 
 
 class TestKey:
@@ -19,7 +21,61 @@ class TestKey:
             _ = Key(ids=ids, name=name)
 
 
+class TestKeys:
+    def test_key_slots(self) -> None:
+        keys = Keys()
+        keys.QUIT.set_ids(1, 2)
+        keys.NEXT.set_ids(3)
+
+        def quit_slot() -> None:
+            pass
+
+        def next_slot() -> None:
+            pass
+
+        assert keys.key_slots(QUIT=quit_slot, NEXT=next_slot) == {
+            1: quit_slot,
+            2: quit_slot,
+            3: next_slot,
+        }
+
+    def test_dispatch_key_function_is_deprecated(self) -> None:
+        keys = Keys()
+        keys.QUIT.set_ids(1)
+        pressed: list[int] = []
+
+        with pytest.warns(DeprecationWarning):
+            keys.QUIT.connect(lambda: pressed.append(1))
+
+        with pytest.warns(DeprecationWarning):
+            dispatch = keys.dispatch_key_function()
+
+        dispatch(1)
+        dispatch(2)
+
+        assert pressed == [1]
+
+
 class TestPresentationConfig:
+    def test_from_files(self, slides_folder: Path) -> None:
+        paths = [slides_folder / "BasicSlide.json"] * 2
+        configs = PresentationConfig.from_files(paths)
+        assert configs == [PresentationConfig.from_file(path) for path in paths]
+
+    def test_from_files_error_location(
+        self, slides_folder: Path, tmp_path: Path
+    ) -> None:
+        invalid = tmp_path / "slides" / "BasicSlide.json"
+        invalid.parent.mkdir()
+        shutil.copy(slides_folder / "BasicSlide.json", invalid)  # Files are missing
+
+        with pytest.raises(ValidationError) as e:
+            _ = PresentationConfig.from_files(
+                [slides_folder / "BasicSlide.json", invalid]
+            )
+
+        assert all(error["loc"][0] == str(invalid) for error in e.value.errors())
+
     def test_validate(self, presentation_config: PresentationConfig) -> None:
         obj = presentation_config.model_dump()
         _ = PresentationConfig.model_validate(obj)
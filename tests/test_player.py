@@ -1 +1,112 @@
-# TODO
+from collections.abc import Iterator
+
+import pytest
+from qtpy.QtMultimedia import QMediaPlayer
+
+from manim_slides.config import Config, PresentationConfig
+from manim_slides.present.player import Player
+from manim_slides.qt_utils import qapp
+
+
+class LoopingMediaPlayer:
+    """Stand-in media player, whose position is set by the tests."""
+
+    def __init__(self, position: int, duration: int = 1000) -> None:
+        self.status = QMediaPlayer.MediaStatus.BufferedMedia
+        self.pos = position
+        self.dur = duration
+        self.stopped = False
+
+    def mediaStatus(self) -> QMediaPlayer.MediaStatus:  # noqa: N802
+        return self.status
+
+    def position(self) -> int:
+        return self.pos
+
+    def duration(self) -> int:
+        return self.dur
+
+    def playbackRate(self) -> float:  # noqa: N802
+        return 1.0
+
+    def setLoops(self, loops: int) -> None:  # noqa: N802
+        pass
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+@pytest.fixture
+def player(presentation_config: PresentationConfig) -> Iterator[Player]:
+    qapp()
+    player = Player(
+        Config(),
+        [presentation_config],
+        next_terminates_loop=True,
+        hide_info_window=True,
+    )
+    player.set_loops(-1)
+
+    yield player
+
+    player.loop_termination_timer.stop()
+    player.deleteLater()
+
+
+@pytest.fixture
+def media_player(
+    player: Player, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[LoopingMediaPlayer]:
+    media_player = LoopingMediaPlayer(position=600)
+    monkeypatch.setattr(player, "media_player", media_player)
+    player.playback_state_changed(QMediaPlayer.PlaybackState.PlayingState)
+    player.next()
+
+    yield media_player
+
+
+def test_next_terminates_loop(player: Player, media_player: LoopingMediaPlayer) -> None:
+    assert player.loop_termination_timer.isActive()
+    assert player.loop_termination_timer.remainingTime() <= 400
+
+
+def test_finish_loop_ignores_end_of_media(
+    player: Player, media_player: LoopingMediaPlayer
+) -> None:
+    player.loop_termination_timer.stop()
+    media_player.status = QMediaPlayer.MediaStatus.EndOfMedia
+    player.finish_loop()
+
+    assert not media_player.stopped
+    assert not player.loop_termination_timer.isActive()
+
+
+def test_finish_loop_waits_for_end_of_iteration(
+    player: Player, media_player: LoopingMediaPlayer
+) -> None:
+    player.loop_termination_timer.stop()
+    media_player.pos = 990
+    player.finish_loop()
+
+    assert not media_player.stopped
+    assert player.loop_termination_timer.isActive()
+
+
+def test_finish_loop_stops_after_iteration(
+    player: Player, media_player: LoopingMediaPlayer, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    assert not player.current_slide_config.auto_next
+
+    player.loop_termination_timer.stop()
+    media_player.pos = 10  # The media looped back to its start
+    player.finish_loop()
+
+    assert media_player.stopped
+
+    # Stopped, not paused, so the next press moves to the next slide
+    player.playback_state_changed(QMediaPlayer.PlaybackState.StoppedState)
+    calls: list[None] = []
+    monkeypatch.setattr(player, "load_next_slide", lambda: calls.append(None))
+    player.next()
+
+    assert calls == [None]
@@ -1,6 +1,8 @@
+import pytest
 from qtpy.QtWidgets import QApplication
 
-from manim_slides.qt_utils import qapp
+from manim_slides import qt_utils
+from manim_slides.qt_utils import app_icon, qapp, reset_qapp
 
 
 def test_qapp() -> None:
@@ -12,3 +14,34 @@ def test_duplicated_qapp() -> None:
     app2 = qapp()
 
     assert app1 == app2
+
+
+def test_app_icon() -> None:
+    _ = qapp()
+    icon = app_icon()
+
+    assert not icon.isNull()
+    assert app_icon() is icon
+
+
+def test_reset_qapp(monkeypatch: pytest.MonkeyPatch) -> None:
+    app = qapp()
+    reset_qapp()
+
+    assert qt_utils._APP is None
+
+    new_app = object()
+
+    class NewApplication:
+        @staticmethod
+        def instance() -> object:
+            return new_app
+
+    # Simulate the previous instance being replaced by a new one
+    monkeypatch.setattr(qt_utils, "QApplication", NewApplication)
+
+    try:
+        assert qapp() is new_app
+        assert qapp() is not app
+    finally:
+        reset_qapp()
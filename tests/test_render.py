@@ -0,0 +1,63 @@
+import importlib
+import sys
+from pathlib import Path
+
+import click
+import pytest
+
+from manim_slides.render import run_module
+
+
+@pytest.fixture
+def module(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> str:
+    name = "_manim_slides_test_module"
+    (tmp_path / f"{name}.py").write_text(
+        "import sys\n"
+        "\n"
+        "if sys.argv[1] == 'int':\n"
+        "    sys.exit(3)\n"
+        "elif sys.argv[1] == 'str':\n"
+        "    sys.exit('Something went wrong')\n"
+        "print(' '.join(sys.argv[1:]))\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, name, raising=False)
+    return name
+
+
+def test_run_module(module: str, capsys: pytest.CaptureFixture[str]) -> None:
+    argv = sys.argv
+    run_module(module, "hello", "world")
+
+    assert capsys.readouterr().out == "hello world\n"
+    assert sys.argv is argv
+
+
+def test_run_module_exit_code(module: str) -> None:
+    with pytest.raises(click.exceptions.Exit) as exc_info:
+        run_module(module, "int")
+
+    assert exc_info.value.exit_code == 3
+
+
+def test_run_module_already_imported_exit_code(
+    module: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("PYTHONPATH", str(tmp_path))
+    monkeypatch.setattr(sys, "argv", [module, "hello"])
+    importlib.import_module(module)  # Forces running in a new interpreter
+
+    with pytest.raises(click.exceptions.Exit) as exc_info:
+        run_module(module, "int")
+
+    assert exc_info.value.exit_code == 3
+
+
+def test_run_module_exit_message(
+    module: str, capsys: pytest.CaptureFixture[str]
+) -> None:
+    with pytest.raises(click.exceptions.Exit) as exc_info:
+        run_module(module, "str")
+
+    assert exc_info.value.exit_code == 1
+    assert capsys.readouterr().err == "Something went wrong\n"
@@ -334,6 +334,16 @@ class TestSlide:
                 self.next_slide()
                 self.wait(5.0)
 
+    def test_identical_slides(self) -> None:
+        @assert_renders
+        class _(CESlide):
+            """Identical slides share the same files, which must only be written once."""
+
+            def construct(self) -> None:
+                for _ in range(4):
+                    self.wait(1.0)
+                    self.next_slide()
+
     def test_file_too_long(self) -> None:
         @assert_renders
         class _(CESlide):
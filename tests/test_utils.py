@@ -1,6 +1,16 @@
+from collections.abc import Iterator
 from pathlib import Path
 
-from manim_slides.utils import merge_basenames
+import pytest
+
+from manim_slides import utils
+from manim_slides.utils import (
+    atomic_write,
+    copy_file,
+    merge_basenames,
+    reverse_video_file,
+    reverse_video_files,
+)
 
 
 def test_merge_basenames(paths: list[Path]) -> None:
@@ -20,3 +30,97 @@ def test_merge_basenames_same_with_different_parent_directories(
     p4 = d2 / "d/e/f/two.txt"
 
     assert merge_basenames([p1, p2]).name == merge_basenames([p3, p4]).name
+
+
+def test_reverse_video_files(video_file: Path, tmp_path: Path) -> None:
+    srcs_and_dests = [
+        (video_file, tmp_path / f"{i}_reversed{video_file.suffix}") for i in range(3)
+    ]
+    reverse_video_files(srcs_and_dests, max_segment_duration=None, num_processes=2)
+
+    for _, dest in srcs_and_dests:
+        assert dest.exists()
+
+
+def test_reverse_single_video_file(video_file: Path, tmp_path: Path) -> None:
+    dest = tmp_path / f"reversed{video_file.suffix}"
+    reverse_video_files([(video_file, dest)], max_segment_duration=None)
+
+    assert dest.exists()
+
+
+def test_reverse_video_file_segments_order(
+    video_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    concatenated: list[str] = []
+
+    def concatenate_video_files(files: list[Path], dest: Path) -> None:
+        concatenated.extend(file.name for file in files)
+
+    monkeypatch.setattr(utils, "concatenate_video_files", concatenate_video_files)
+    reverse_video_file(
+        video_file,
+        tmp_path / f"reversed{video_file.suffix}",
+        max_segment_duration=0.01,
+        num_processes=2,
+    )
+
+    # Reversed segments must be concatenated from the last one to the first one
+    assert concatenated
+    assert concatenated == sorted(concatenated, reverse=True)
+
+
+def test_reverse_video_files_propagates_errors(
+    video_file: Path, tmp_path: Path
+) -> None:
+    def srcs_and_dests() -> Iterator[tuple[Path, Path]]:
+        yield video_file, tmp_path / f"reversed{video_file.suffix}"
+
+        try:
+            raise KeyError("cause")
+        except KeyError as e:
+            raise ValueError("Failed to produce file") from e
+
+    with pytest.raises(ValueError, match="Failed to produce file") as e:
+        reverse_video_files(srcs_and_dests(), max_segment_duration=None)
+
+    assert isinstance(e.value.__cause__, KeyError)
+
+
+def test_copy_file(video_file: Path, tmp_path: Path) -> None:
+    dest = tmp_path / video_file.name
+    copy_file(video_file, dest)
+    copy_file(video_file, dest)  # Overwriting must not fail
+
+    assert dest.read_bytes() == video_file.read_bytes()
+
+
+def test_copy_file_is_independent_of_source(tmp_path: Path) -> None:
+    src = tmp_path / "src.mp4"
+    dest = tmp_path / "dest.mp4"
+    src.write_bytes(b"original")
+    copy_file(src, dest)
+
+    # Renderers may overwrite their files in place
+    with open(src, "r+b") as f:
+        f.write(b"modified")
+
+    assert dest.read_bytes() == b"original"
+
+
+def test_atomic_write(tmp_path: Path) -> None:
+    dest = tmp_path / "dest.mp4"
+    dest.write_bytes(b"previous")
+
+    with pytest.raises(RuntimeError), atomic_write(dest) as tmp:
+        tmp.write_bytes(b"trunc")
+        raise RuntimeError("Interrupted")
+
+    assert dest.read_bytes() == b"previous"
+
+    with atomic_write(dest) as tmp:
+        assert tmp.suffix == dest.suffix
+        tmp.write_bytes(b"complete")
+
+    assert dest.read_bytes() == b"complete"
+    assert list(tmp_path.iterdir()) == [dest]